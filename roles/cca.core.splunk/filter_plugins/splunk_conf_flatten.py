@@ -1,33 +1,81 @@
 # CCA Splunk conf flatten
 
+from functools import wraps
+
 from ansible.errors import AnsibleFilterError
 
+class _Strings(dict):
+    ''' Hands out one shared instance per distinct string looked up '''
+
+    def __missing__(self, key):
+        self[key] = key
+        return key
+
+def _iter_entries(conf_groups):
+    ''' Yield (path, section, option, value, state, comment) for every option
+    in a named section of each conf group '''
+    strings = _Strings()
+    for group in conf_groups:
+        path = strings[group['filepath'] + '/' + group['filename']]
+        for section in group['sections'] if 'sections' in group else ():
+            section_name = section.get('section')
+            if not section_name:
+                continue
+            for option in section['options'] if 'options' in section else ():
+                yield (
+                    path,
+                    section_name,
+                    option.get('option'),
+                    option.get('value'),
+                    option.get('state','present'),
+                    option.get('comment', ''),
+                )
+
 def splunk_conf_flatten(conf_groups):
-    try:
-        flattened_data = []
-        for group in conf_groups:
-            filepath = group.get('filepath')
-            filename = group.get('filename')
-            for section in group.get('sections', []):
-                section_name = section.get('section')
-                if section_name != '':
-                    for option in section.get('options', []):
-                        flattened_data.append({
-                            'path': filepath + '/' + filename,
-                            'section': section_name,
-                            'option': option.get('option'),
-                            'value': option.get('value'),
-                            'state': option.get('state','present'),
-                            'comment': option.get('comment', ''),
-                        })
-        return flattened_data
-    except Exception as e:
-        raise AnsibleFilterError('Error flattening configuration data: {}'.format(e))
+    return [{
+        'path': path,
+        'section': section,
+        'option': option,
+        'value': value,
+        'state': state,
+        'comment': comment,
+    } for path, section, option, value, state, comment in _iter_entries(conf_groups)]
+
+def splunk_conf_flatten_columnar(conf_groups):
+    ''' Same entries as splunk_conf_flatten, as one list per field '''
+    paths, sections, options, values, states, comments = [], [], [], [], [], []
+    for path, section, option, value, state, comment in _iter_entries(conf_groups):
+        paths.append(path)
+        sections.append(section)
+        options.append(option)
+        values.append(value)
+        states.append(state)
+        comments.append(comment)
+    return {
+        'path': paths,
+        'section': sections,
+        'option': options,
+        'value': values,
+        'state': states,
+        'comment': comments,
+    }
+
+def _filter_errors(func):
+    ''' Report malformed conf data as an AnsibleFilterError '''
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except (AttributeError, KeyError, TypeError) as e:
+            raise AnsibleFilterError('Error flattening configuration data: {}'.format(e)) from e
+    return wrapper
 
 class FilterModule(object):
     ''' Ansible custom filter plugin for flattening Splunk configuration data '''
 
     def filters(self):
         return {
-            'splunk_conf_flatten': splunk_conf_flatten
+            'splunk_conf_flatten': _filter_errors(splunk_conf_flatten),
+            'splunk_conf_flatten_columnar': _filter_errors(splunk_conf_flatten_columnar)
         }
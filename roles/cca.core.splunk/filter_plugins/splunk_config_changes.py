@@ -1,6 +1,29 @@
 # filter_plugins/splunk_config_changes.py
 
-import re
+def _scan_changes(paths, restart=False, reload=False, push=False, cm_push=False):
+    ''' Classify changed paths by the directory directly under etc/
+
+    Bundle/deployment directories map to their own action, a change anywhere
+    else under etc/ requires a splunkd restart. Returns the updated
+    (restart, reload, push, cm_push) flags.
+    '''
+    for path in paths:
+        # Nothing left to detect once every action is set
+        if restart and reload and push and cm_push:
+            break
+        idx = path.find('/etc/')
+        if idx == -1:
+            continue
+        after = idx + 5
+        if path.startswith('deployment-apps', after):
+            reload = True
+        elif path.startswith('shcluster', after):
+            push = True
+        elif path.startswith(('master-apps', 'manager-apps'), after):
+            cm_push = True
+        else:
+            restart = True
+    return restart, reload, push, cm_push
 
 class FilterModule(object):
     def filters(self):
@@ -19,16 +42,17 @@ class FilterModule(object):
         if rolling_restart_pending:
             actions['splunkd_restart'] = True
 
-        for item in results:
-            if item['changed']:
-                path = item.get('path', '')
-                if bool(re.search('.*/etc/(?!deployment-apps|shcluster|master-apps|manager-apps).*?$', path)):
-                    actions['splunkd_restart_pending'] = True
-                elif 'deployment-apps' in path:
-                    actions['deploymentserver_reload'] = True
-                elif 'shcluster' in path:
-                    actions['deployer_push'] = True
-                elif 'master-apps' in path or 'manager-apps' in path:
-                    actions['cluster_manager_push'] = True
+        changed_paths = [item.get('path', '') for item in results if item['changed']]
+
+        (actions['splunkd_restart_pending'],
+         actions['deploymentserver_reload'],
+         actions['deployer_push'],
+         actions['cluster_manager_push']) = _scan_changes(
+            changed_paths,
+            actions['splunkd_restart_pending'],
+            actions['deploymentserver_reload'],
+            actions['deployer_push'],
+            actions['cluster_manager_push'],
+        )
 
         return actions